@@ -1,6 +1,6 @@
 # MODULES (EXTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
-from pathlib import Path
+import os
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -11,7 +11,7 @@ from pathlib import Path
 # OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
 # ---------------------------------------------------------------------------------------------------------------------
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 """
 Absolute path to the root of the project.
 """
@@ -26,6 +26,11 @@ ALGORITHM_VERSION = '0.18.4'
 Current version of the algorithm.
 """
 
+NAMESPACE_PREFIX = '__ns__:'
+"""
+Prefix that marks the namespaces declared by a C# module among its imports.
+"""
+
 NO_MODULE = 'This module does not contain documentation on classes or functions.'
 """
 Message to print when a module has no documentation.
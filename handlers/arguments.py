@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import stat
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from argparse import ArgumentParser
 
@@ -38,6 +40,25 @@ class Arguments:
             Namespace: 
                 Object with parsed and validated arguments.
         """
+        parser = cls.__parser()
+        args = parser.parse_args()
+
+        cls.__validate(args, parser)
+
+        return args
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def __parser() -> ArgumentParser:
+        """
+        Builds the parser with the arguments accepted by the algorithm.
+
+        The parser is built only once per process and is reused in subsequent calls.
+
+        Returns:
+            ArgumentParser:
+                Parser with the required and optional arguments defined.
+        """
         parser = ArgumentParser(
             description="Required and optional arguments for executing the algorithm"
         )
@@ -65,11 +86,7 @@ class Arguments:
             help="Additional files/extensions to exclude from the scan, separated by commas if multiple are specified"
         )
 
-        args = parser.parse_args()
-
-        cls.__validate(args, parser)
-
-        return args
+        return parser
 
     @staticmethod
     def __validate(args: Namespace, parser: ArgumentParser) -> None:
@@ -87,10 +104,20 @@ class Arguments:
                 If any validation fails, `parser.error` is invoked, which stops execution 
                 and displays the corresponding error message.
         """
-        if args.output and os.path.exists(args.output) and not os.path.isdir(args.output):
-            parser.error("The parameter sent in `--output` must be a directory!")
-
-        if not os.path.isdir(args.repository):
+        # A single `stat` call checks both the existence and the type of each path
+        if args.output:
+            try:
+                if not stat.S_ISDIR(os.stat(args.output).st_mode):
+                    parser.error("The parameter sent in `--output` must be a directory!")
+            except OSError:
+                pass # It does not exist yet, it will be created before generating the files
+
+        try:
+            is_dir = stat.S_ISDIR(os.stat(args.repository).st_mode)
+        except OSError:
+            is_dir = False
+
+        if not is_dir:
             parser.error("The parameter sent in `--repository` must be a valid directory!")
 
 # ---------------------------------------------------------------------------------------------------------------------
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import os
 import logging
-from logging.handlers import RotatingFileHandler
-from typing import TYPE_CHECKING
+import multiprocessing
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from logging import Logger
+    from multiprocessing.queues import Queue
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -30,8 +32,15 @@ class HandlerLogger:
     **Key points:**
         - **Different levels:**
             - Algorithm → supports `DEBUG`, `INFO`, `WARNING`, `ERROR`.
+        - **Non-blocking:**
+            - The logger only places the records in a queue, a background thread (`QueueListener`) is 
+            in charge of writing them to the file and the console.
+            - The queue can be shared with the worker processes of the analysis through `worker`.
     """
 
+    __queue: Optional[Queue] = None
+    __listener: Optional[QueueListener] = None
+
     @classmethod
     def set(cls, output: str) -> None:
         """
@@ -51,15 +60,57 @@ class HandlerLogger:
         # so that they are not duplicated in other handlers
         logger.propagate = False
         
-        logger.addHandler(cls.__handler(file=os.path.join(output, FILE)))
-        logger.addHandler(cls.__stream_handler())
-        
+        # A process-safe queue is used so that the worker processes can also send their records
+        cls.__queue = multiprocessing.Queue()
+        cls.__listener = QueueListener(
+            cls.__queue,
+            cls.__handler(file=os.path.join(output, FILE)),
+            cls.__stream_handler(),
+            respect_handler_level=True
+        )
+        cls.__listener.start()
+
+        logger.addHandler(QueueHandler(cls.__queue))
+
+    @classmethod
+    def queue(cls) -> Optional[Queue]:
+        """
+        Returns the queue where the records of the **Algorithm** layer are sent.
+
+        Returns:
+            (Queue | None):
+                Queue shared with the listener, or `None` if the logger has not been configured.
+        """
+        return cls.__queue
+
     @staticmethod
-    def close(logger: Logger) -> None:
+    def worker(queue: Optional[Queue]) -> None:
+        """
+        Configures the logger associated with the **Algorithm** layer inside a worker process.
+
+        The records are only sent to the queue received, the listener of the main process is 
+        responsible for writing them.
+
+        Args:
+            queue (Queue | None):
+                Queue obtained with `queue` in the main process.
+        """
+        if queue is None:
+            return
+
+        logger = logging.getLogger(ALGORITHM)
+        logger.handlers.clear() # Handlers inherited from the main process (if any) are discarded
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(QueueHandler(queue))
+
+    @classmethod
+    def close(cls, logger: Logger) -> None:
         """
         Closes and removes all handlers associated with a specific logger.
 
-        - Iterates through all active handlers of the logger.
+        - Stops the listener, writing the records still pending in the queue.
+        - Iterates through all active handlers of the logger and the listener.
         - Closes each handler to free file descriptors.
         - Removes the handlers from the logger to leave it clean.
 
@@ -67,6 +118,18 @@ class HandlerLogger:
             logger (Logger):
                 Instance of the logger to be closed.
         """
+        if cls.__listener is not None:
+            cls.__listener.stop()
+
+            for handler in cls.__listener.handlers:
+                handler.close()
+
+            cls.__listener = None
+
+        if cls.__queue is not None:
+            cls.__queue.close()
+            cls.__queue = None
+
         lst_handlers = logger.handlers[:]
         for handler in lst_handlers:
             handler.close()
@@ -0,0 +1,228 @@
+# MODULES (EXTERNAL)
+# ---------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import os
+import dbm
+import pickle
+import shelve
+import hashlib
+from typing import Optional, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from src.models import ModuleInfo
+# ---------------------------------------------------------------------------------------------------------------------
+
+# MODULES (INTERNAL)
+# ---------------------------------------------------------------------------------------------------------------------
+from common.constants import ALGORITHM_VERSION
+# ---------------------------------------------------------------------------------------------------------------------
+
+# OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
+# ---------------------------------------------------------------------------------------------------------------------
+
+FILE = 'Analysis-Cache'
+
+# Version of the stored entries, it must be increased whenever the content produced by the analyzers
+# changes (e.g. blank documentation stored as `None`) or the layout of the stored models changes 
+# (e.g. slotted metrics) or the layout of the entries changes, so that previous entries are discarded
+VERSION = (ALGORITHM_VERSION, 4)
+
+class AnalysisCache:
+    """
+    Class responsible for persisting the analysis of each module between executions.
+
+    **Purpose:**
+        - Avoid reading and parsing again the files that have not changed since the last execution.
+        - Store the `ModuleInfo` obtained for each file in a sidecar file within the output directory.
+
+    Each entry is identified by the absolute path of the file and is only considered valid if the
+    modification date (`st_mtime_ns`), the size (`st_size`) and the version of the entries match
+    those recorded when it was stored.
+
+    If only the signature differs (e.g. a fresh clone or checkout, where every file gets a new
+    modification date), the content hash recorded with the entry is compared, so that files whose
+    content has not changed are still reused and their signature is updated.
+
+    The entries of files that no longer exist in the repository are removed with `prune`.
+
+    It must be used as a context manager so that the storage is closed correctly.
+    """
+
+    def __init__(self, output: str) -> None:
+        self.__file = os.path.join(output, FILE)
+        self.__store: Optional[shelve.Shelf] = None
+
+    def __enter__(self) -> AnalysisCache:
+        try:
+            self.__store = shelve.open(self.__file, protocol=pickle.HIGHEST_PROTOCOL)
+        except (*dbm.error, ValueError, SyntaxError):
+            # Corrupt storage, recreated empty (`dbm.dumb` evaluates its index, so a truncated or 
+            # damaged one raises `ValueError` or `SyntaxError` instead of `dbm.error`)
+            self.__store = shelve.open(self.__file, flag='n', protocol=pickle.HIGHEST_PROTOCOL)
+
+        return self
+
+    def __exit__(self, *_) -> None:
+        if self.__store is not None:
+            self.__store.close()
+            self.__store = None
+
+    def get(self, path: Path) -> Optional[ModuleInfo]:
+        """
+        Retrieves the stored analysis of a file if it is still valid.
+
+        Args:
+            path (Path):
+                Path of the file whose analysis is being requested.
+
+        Returns:
+            (ModuleInfo | None):
+                Analysis stored for the file, or `None` if it does not exist, is outdated
+                or could not be read.
+        """
+        try:
+            entry = self.__store.get(str(path))
+        except Exception:
+            return None # Unreadable entries (e.g. models that have changed) are treated as missing
+
+        if entry is None or entry[0] != VERSION:
+            return None
+
+        _, signature, digest, module = entry
+        current = self.__signature(path)
+        if current is None:
+            return None
+
+        if signature != current:
+            # The content is only hashed when the signature no longer matches
+            if digest != self.__file_digest(path):
+                return None
+
+            self.__store[str(path)] = (VERSION, current, digest, module)
+
+        return module
+
+    def stamp(self, path: Path) -> Optional[tuple]:
+        """
+        Obtains the signature of a file, which must be taken before it is analyzed, so that a file 
+        modified during the execution is not stored with a signature that does not belong to the 
+        analyzed content.
+
+        Args:
+            path (Path):
+                Path of the file that is going to be analyzed.
+
+        Returns:
+            (tuple | None):
+                Signature of the file, or `None` if the file cannot be accessed.
+        """
+        return self.__signature(path)
+
+    def set(self, path: Path, module: ModuleInfo, signature: tuple, digest: str) -> None:
+        """
+        Stores the analysis of a file together with the signature and content hash it was analyzed with.
+
+        Args:
+            path (Path):
+                Path of the analyzed file.
+            module (ModuleInfo):
+                Result of the analysis of the file.
+            signature (tuple):
+                Signature obtained with `stamp` before the analysis.
+            digest (str):
+                Hash obtained with `digest` from the content read by the analysis.
+        """
+        self.__store[str(path)] = (VERSION, signature, digest, module)
+
+    def prune(self, paths: Iterable[Path]) -> int:
+        """
+        Removes the entries of the files that no longer exist in the repository (deleted or renamed).
+
+        The storage does not reclaim the space of the removed entries, so when any entry is removed 
+        it is rewritten with the remaining ones.
+
+        Args:
+            paths (Iterable[Path]):
+                Paths of the files currently found in the repository.
+
+        Returns:
+            int:
+                Number of entries removed.
+        """
+        current = {str(path) for path in paths}
+        stale = [key for key in self.__store.keys() if key not in current]
+        if not stale:
+            return 0
+
+        # The entries are copied as stored (already serialized), without being loaded again
+        raw = self.__store.dict
+        entries = {key: raw[key] for key in raw.keys() if key.decode() in current}
+
+        self.__store.close()
+        self.__store = shelve.open(self.__file, flag='n', protocol=pickle.HIGHEST_PROTOCOL)
+        for key, value in entries.items():
+            self.__store.dict[key] = value
+
+        return len(stale)
+
+    @staticmethod
+    def __signature(path: Path) -> Optional[tuple]:
+        """
+        Obtains the signature that identifies the current state of a file.
+
+        Args:
+            path (Path):
+                Path of the file.
+
+        Returns:
+            (tuple | None):
+                Tuple with the modification date in nanoseconds and the size of the file,
+                or `None` if the file cannot be accessed.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """
+        Obtains the hash that identifies the content of a file.
+
+        It is calculated from the content already read by the analysis, so that the file is not read twice.
+
+        Args:
+            data (bytes):
+                Raw content of the file.
+
+        Returns:
+            str:
+                BLAKE2b hash of the content.
+        """
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    @staticmethod
+    def __file_digest(path: Path) -> Optional[str]:
+        """
+        Obtains the hash that identifies the current content of a file.
+
+        Args:
+            path (Path):
+                Path of the file.
+
+        Returns:
+            (str | None):
+                BLAKE2b hash of the content of the file, or `None` if the file cannot be read.
+        """
+        try:
+            with open(path, 'rb') as file:
+                return AnalysisCache.digest(file.read())
+        except OSError:
+            return None
+
+# ---------------------------------------------------------------------------------------------------------------------
+# END OF FILE
\ No newline at end of file
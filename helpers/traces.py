@@ -17,6 +17,16 @@ from common.constants import PROJECT_ROOT
 # OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
 # ---------------------------------------------------------------------------------------------------------------------
 
+ROOT = PROJECT_ROOT.lower()
+"""
+Normalized path of the project root, used to identify the internal traces.
+"""
+
+PACKAGES = ('site-packages', 'dist-packages')
+"""
+Folders of installed libraries, discarded even if they are located under the project root (e.g. a virtual environment).
+"""
+
 class Trace(NamedTuple):
     filename: str
     line: int
@@ -27,9 +37,9 @@ def error_trace(traces: List[Trace], logger: Logger, error: Exception) -> None:
     """
     It records an error in the logger, filtering only the traces that belong to the project's internal code.
 
-    Based on the traceback information, entries whose path is not under the project root are discarded. This way, 
-    the resulting error message focuses on the exact point where the application's own logic failed, ignoring calls 
-    from external libraries or the system.
+    Based on the traceback information, entries whose path is not under the project root (or that belong to installed 
+    libraries) are discarded. This way, the resulting error message focuses on the exact point where the application's 
+    own logic failed, ignoring calls from external libraries or the system.
 
     Args:
         traces (List[Trace]):
@@ -39,23 +49,20 @@ def error_trace(traces: List[Trace], logger: Logger, error: Exception) -> None:
         error (Exception):
             Captured exception that caused the failure.
     """
-    root = _normalize(PROJECT_ROOT)
-
-    internal = [
-        trace for trace in traces
-        if _normalize(trace[0]).startswith(root)
-    ]
-
-    if not internal:
-        logger.error(f"{error} - No relevant internal traces were found")
+    # The traces are traversed from the most recent one, the last call in the traceback of the project itself 
+    # usually indicates the point where the internal logic actually failed, so the search stops there
+    for trace in reversed(traces):
+        filename = _normalize(trace[0])
+        if filename.startswith(ROOT) and not any(folder in filename for folder in PACKAGES):
+            break
+    else:
+        logger.error("%s - No relevant internal traces were found", error)
         return
-    
-    # The last call in the traceback of the project itself usually 
-    # indicates the point where the internal logic actually failed
-    filename, line, funcname, text = internal[-1]
+
+    filename, line, funcname, text = trace
 
     about = f'while processing {text}' if text else ''
-    logger.error(f"{error} occurred {about} in function {funcname} (file: {filename}, line: {line})")
+    logger.error("%s occurred %s in function %s (file: %s, line: %s)", error, about, funcname, filename, line)
 
 def _normalize(path: str) -> str:
     """
@@ -1,14 +1,19 @@
 # MODULES (EXTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
 import os
+import sys
 import time
-import psutil
 import logging
+from typing import Optional
+
+try:
+    import resource # Only available on POSIX systems
+except ImportError:
+    resource = None
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
-from src.execute import execute
 from common.settings import Settings
 from handlers.arguments import Arguments
 from handlers.logger import HandlerLogger
@@ -18,11 +23,39 @@ from common.constants import ALGORITHM, ALGORITHM_VERSION
 # OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
 # ---------------------------------------------------------------------------------------------------------------------
 
+def peak_memory() -> Optional[float]:
+    """
+    Obtains the peak memory used by the execution, in megabytes.
+
+    The maximum resident set size of the process and of its workers is read from `resource`, which 
+    has no cost during the execution. It is not measured on systems without `resource` (e.g. Windows), 
+    since tracing the allocations would slow down the whole execution and would only cover the main 
+    process, while the analysis runs in the worker processes.
+
+    Returns:
+        (float | None):
+            Peak memory in megabytes, rounded to two decimals, or `None` if it cannot be measured.
+    """
+    if resource is None:
+        return None
+
+    usage = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    unit = 1 if sys.platform == 'darwin' else 1024 # macOS reports bytes, the rest of systems kilobytes
+
+    return round(usage * unit / pow(1024, 2), 2)
+
 if __name__ == '__main__':
     start = time.time()
-    before = psutil.virtual_memory().used
+    args = Arguments.get()
 
-    settings = Settings(Arguments.get())
+    # Heavy modules are imported once the arguments are valid, so that `--help` 
+    # or an argument error does not have to pay for their loading
+    from src.execute import execute
+
+    settings = Settings(args)
 
     os.makedirs(settings.output, exist_ok=True)
 
@@ -30,16 +63,22 @@ if __name__ == '__main__':
 
     logger = logging.getLogger(ALGORITHM)
     logger.info("Execution summary")
-    logger.info(f"Algorithm version: {ALGORITHM_VERSION}")
+    logger.info("Algorithm version: %s", ALGORITHM_VERSION)
+
+    try:
+        execute(settings)
 
-    execute(settings)
+        end = time.time()
 
-    end = time.time()
-    after = psutil.virtual_memory().used
+        logger.info("Total execution time: %s seconds", round(end - start, 3))
 
-    logger.info(f"Total execution time: {round(end - start, 3)} seconds")
-    logger.info(f"Total memory consumed: {round((after - before) / pow(1024, 2), 2)} megabytes")
-    HandlerLogger.close(logger)
+        peak = peak_memory()
+        if peak is not None:
+            logger.info("Peak memory used: %s megabytes", peak)
+    finally:
+        # The listener is also stopped if the execution fails, so that the records still pending 
+        # in the queue are written and its thread does not outlive the interpreter
+        HandlerLogger.close(logger)
 
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
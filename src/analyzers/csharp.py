@@ -1,6 +1,7 @@
 # MODULES (EXTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
 import re
+import sys
 import logging
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -10,7 +11,7 @@ from typing import List, Optional
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
 from src.models import *
-from common.constants import ALGORITHM
+from common.constants import ALGORITHM, NAMESPACE_PREFIX
 from src.utils.metrics import module_metrics
 # ---------------------------------------------------------------------------------------------------------------------
 
@@ -72,7 +73,7 @@ logger = logging.getLogger(ALGORITHM)
 Instance of the logger used by the analysis module.
 """
 
-def analyze_csharp(path: Path, framework: str) -> ModuleInfo:
+def analyze_csharp(path: Path, framework: str, data: Optional[bytes] = None) -> ModuleInfo:
     """
     Analyzes a C# file, obtaining structural information: classes, methods, attributes, 
     XML documentation, and metrics.
@@ -94,19 +95,27 @@ def analyze_csharp(path: Path, framework: str) -> ModuleInfo:
             Path of the C# file to be analyzed.
         framework (str):
             Name of the framework used, which must have a compatible mapping method.
+        data (bytes, optional):
+            Raw content of the file, if it has already been read.
 
     Returns:
         ModuleInfo:
             Object with all the structural and documentary information of the C# file.
     """
-    src = path.read_text(encoding='utf-8', errors='ignore')
+    if data is None:
+        data = path.read_bytes()
+
+    src = data.decode('utf-8', errors='ignore')
+    if '\r' in src:
+        src = src.replace('\r\n', '\n').replace('\r', '\n') # Same translation of line breaks as `read_text`
+
     src = src.lstrip('\ufeff') # Remove the BOM, which is common in files generated by Windows tools
     lines = src.splitlines()
 
     classes: List[ClassInfo] = []
 
     for cls_match in CLASS_RE.finditer(src):
-        cls_name = cls_match.group(2)
+        cls_name = sys.intern(cls_match.group(2))
         cls_lineno = src.count('\n', 0, cls_match.start()) + 1 # Exact line where the class begins
         cls_info = ClassInfo(
             name=cls_name, 
@@ -121,7 +130,7 @@ def analyze_csharp(path: Path, framework: str) -> ModuleInfo:
         idx_brace = src.find('{', cls_match.end())
         if idx_brace == -1:
             kind = cls_match.group(1) # class, record, struct, interface
-            logger.warning(f"Could not find '{{' for {kind} {cls_name} in {path.name} (Line {cls_lineno})")
+            logger.warning("Could not find '{' for %s %s in %s (Line %s)", kind, cls_name, path.name, cls_lineno)
             classes.append(cls_info)
             continue
 
@@ -149,7 +158,7 @@ def analyze_csharp(path: Path, framework: str) -> ModuleInfo:
             method_lineno = src.count('\n', 0, idx_brace + method.start()) + 1
             cls_info.methods.append(
                 FunctionInfo(
-                    name=method.group(1),
+                    name=sys.intern(method.group(1)),
                     lineno=method_lineno,
                     doc=_collect_xml_text(lines, method_lineno - 1),
                     decorators=_collect_decorators(lines, method_lineno - 1)
@@ -160,7 +169,7 @@ def analyze_csharp(path: Path, framework: str) -> ModuleInfo:
             attr_lineno = src.count('\n', 0, idx_brace + attr.start()) + 1
             cls_info.attributes.append(
                 AttributeInfo(
-                    name=attr.group(1), 
+                    name=sys.intern(attr.group(1)), 
                     lineno=attr_lineno, 
                     doc=_collect_xml_text(lines, attr_lineno - 1)
                 )
@@ -460,7 +469,8 @@ def _collect_xml_text(lines: List[str], start_idx: int) -> Optional[str]:
 
     Returns:
         (str | None):
-            Processed and cleaned text from the documentation, or None if there is no associated documentation.
+            Processed and cleaned text from the documentation, or None if there is no associated documentation
+            or it is blank.
     """
     idx = start_idx - 1
     buffer: List[str] = []
@@ -494,14 +504,16 @@ def _collect_xml_text(lines: List[str], start_idx: int) -> Optional[str]:
     raw = '\n'.join(buffer)
 
     if not any(tag in raw for tag in ('<summary', '<param', '<returns', '<exception')):
-        return raw
+        doc = raw
+    else:
+        # It is wrapped in a <root> to make it valid XML
+        try:
+            root = ET.fromstring(f'<root>\n{raw}\n</root>')
+            doc = _format_xml_documentation(root)
+        except Exception:
+            doc = raw # If the XML is invalid, the text is returned as is
 
-    # It is wrapped in a <root> to make it valid XML
-    try:
-        root = ET.fromstring(f'<root>\n{raw}\n</root>')
-        return _format_xml_documentation(root)
-    except Exception:
-        return raw # If the XML is invalid, the text is returned as is
+    return doc if doc.strip() else None # Blank documentation is treated as missing
 
 def _format_xml_documentation(root: ET.Element) -> str:
     """
@@ -693,9 +705,7 @@ def _collect_imports(src: str) -> List[str]:
     namespaces = sorted({item.group(1) for item in NAMESPACE_RE.finditer(src)})
     usings = sorted({item.group(1) for item in USING_RE.finditer(src)})
 
-    imports: List[str] = []
-    for ns in namespaces:
-        imports.append(f'__ns__:{ns}')
+    imports: List[str] = [f'{NAMESPACE_PREFIX}{ns}' for ns in namespaces]
 
     imports.extend(usings)
 
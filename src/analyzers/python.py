@@ -2,6 +2,7 @@
 # ---------------------------------------------------------------------------------------------------------------------
 import re
 import ast
+import sys
 import inspect
 import logging
 from pathlib import Path
@@ -31,6 +32,16 @@ RETURNS = ('Returns:', 'Return:')
 SECTIONS = ('Args:', 'Arguments:', 'Parameters:')
 RAISES = ('Raises:', 'Raise:', 'Exceptions:', 'Exception:')
 
+# Uniform header of each section, built once instead of once per docstring
+HEADERS = {
+    **{item: '*Args:*'    for item in SECTIONS},
+    **{item: '*Returns:*' for item in RETURNS},
+    **{item: '*Raises:*'  for item in RAISES},
+}
+
+# Pattern of the items of a section (`name: description`), compiled once for every line of every docstring
+ITEM_PATTERN = re.compile(r'\s*([^:]+):\s*(.*)')
+
 # AST nodes that are commonly expected at module level and should not be considered "unexpected"
 EXPECTED_TOP_LEVEL_NODES = (
     ast.Import,
@@ -42,7 +53,7 @@ EXPECTED_TOP_LEVEL_NODES = (
     ast.Pass
 )
 
-def analyze_python(path: Path, framework: str) -> ModuleInfo:
+def analyze_python(path: Path, framework: str, data: Optional[bytes] = None) -> ModuleInfo:
     """
     Analyzes a Python file and extracts structural information about its modules, classes, and functions.
 
@@ -51,8 +62,9 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
     non-representative nodes (such as imports or single expressions).
 
     **Process details:**
-        - Reads the file with UTF-8 encoding (ignoring errors).
-        - Generates the syntax tree with `ast.parse()`.
+        - Reads the raw file (unless its content is given) and decodes it with UTF-8 encoding (ignoring errors).
+        - Generates the syntax tree by compiling the source with `ast.PyCF_ONLY_AST`.
+        - Reads the docstrings directly from the first statement of each node.
         - Extracts:
             * Module docstring.
             * Top-level functions (`ast.FunctionDef`).
@@ -64,15 +76,25 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
             Path of the Python file to be analyzed.
         framework (str):
             Name of the framework used, which must have a compatible mapping method.
+        data (bytes, optional):
+            Raw content of the file, if it has already been read.
 
     Returns:
         ModuleInfo:
             Object describing the structural content of the module, including its classes, functions, and main 
             docstring.
     """
-    src = path.read_text(encoding='utf-8', errors='ignore')
-    tree = ast.parse(src)
-    doc = ast.get_docstring(tree)
+    if data is None:
+        data = path.read_bytes()
+
+    # Decoding the raw content directly avoids the text layer of `read_text`, whose only additional 
+    # work here is the translation of line breaks, which is only applied when they are present
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+    src = data.decode('utf-8', errors='ignore')
+    tree = compile(src, str(path), 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+    doc = _normalize_document(_docstring(tree)) # Same normalization as classes and functions
 
     funcs: List[FunctionInfo] = []
     classes: List[ClassInfo] = []
@@ -81,26 +103,26 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)): # Higher-level functions (sync + async)
             funcs.append(
                 FunctionInfo(
-                    name=node.name,
+                    name=sys.intern(node.name),
                     lineno=node.lineno,
-                    doc=_normalize_document(ast.get_docstring(node)),
+                    doc=_normalize_document(_docstring(node)),
                     decorators=_collect_decorators(node, src)
                 )
             )
         elif isinstance(node, ast.ClassDef): # Classes
             cls = ClassInfo(
-                name=node.name,
+                name=sys.intern(node.name),
                 lineno=node.lineno,
-                doc=_normalize_document(ast.get_docstring(node)),
+                doc=_normalize_document(_docstring(node)),
                 decorators=_collect_decorators(node, src)
             )
 
             for sub in node.body:
                 if isinstance(sub, (ast.FunctionDef, ast.AsyncFunctionDef)): # Class methods (sync + async)
                     cls.methods.append(FunctionInfo(
-                        name=sub.name,
+                        name=sys.intern(sub.name),
                         lineno=sub.lineno,
-                        doc=_normalize_document(ast.get_docstring(sub)),
+                        doc=_normalize_document(_docstring(sub)),
                         decorators=_collect_decorators(sub, src)
                     ))
 
@@ -109,7 +131,7 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
                         if isinstance(target, ast.Name): # Only attributes defined by simple name are traversed
                             cls.attributes.append(
                                 AttributeInfo(
-                                    name=target.id,
+                                    name=sys.intern(target.id),
                                     lineno=sub.lineno,
                                     doc=None,
                                 )
@@ -118,7 +140,7 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
                     if isinstance(sub.target, ast.Name):
                         cls.attributes.append(
                             AttributeInfo(
-                                name=sub.target.id,
+                                name=sys.intern(sub.target.id),
                                 lineno=sub.lineno,
                                 doc=None,
                             )
@@ -128,8 +150,9 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
 
             classes.append(cls)
         else:
-            # Ignore common top-level nodes (imports, assignments, main guards, etc)
-            if isinstance(node, EXPECTED_TOP_LEVEL_NODES):
+            # Ignore common top-level nodes (imports, assignments, main guards, etc), and do not build 
+            # the summary of the node if the warning is not going to be recorded
+            if isinstance(node, EXPECTED_TOP_LEVEL_NODES) or not logger.isEnabledFor(logging.WARNING):
                 continue
 
             # For any truly unexpected node, log a warning to help detect unanticipated structures
@@ -142,7 +165,7 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
             except Exception:
                 summary = str(node)
 
-            logger.warning(f"Unexpected node in {path.name} (line {lineno}): type={node_type} → {summary}")
+            logger.warning("Unexpected node in %s (line %s): type=%s → %s", path.name, lineno, node_type, summary)
 
     return ModuleInfo(
         path=str(path),
@@ -153,6 +176,34 @@ def analyze_python(path: Path, framework: str) -> ModuleInfo:
         metrics=module_metrics(src, classes, funcs, framework)
     )
 
+def _docstring(node: ast.AST) -> Optional[str]:
+    """
+    Extracts the docstring of a module, class, or function node.
+
+    Equivalent to `ast.get_docstring(node)` (with `clean=True`) but without its type validations, 
+    since the nodes received have already been filtered. The indentation is cleaned here with 
+    `inspect.cleandoc`, as `ast.get_docstring` does, even though `_normalize_document` cleans it 
+    again: a second pass is not idempotent (lines indented deeper than the first one lose their 
+    remaining indentation), and the README relies on that result.
+
+    Args:
+        node (AST):
+            Node of the syntax tree whose docstring is requested.
+
+    Returns:
+        (str | None):
+            Text of the docstring with its indentation cleaned, or `None` if the node does not have one.
+    """
+    body = node.body
+    if not body:
+        return None
+
+    first = body[0]
+    if type(first) is ast.Expr and type(first.value) is ast.Constant and type(first.value.value) is str:
+        return inspect.cleandoc(first.value.value)
+
+    return None
+
 def _normalize_document(doc: Optional[str]) -> Optional[str]:
     """
     Normalizes and formats a docstring to produce consistent Markdown output.
@@ -185,10 +236,10 @@ def _normalize_document(doc: Optional[str]) -> Optional[str]:
     Returns:
         (str | None):
             The fully normalized docstring, ready to be rendered in Markdown, 
-            or `None` if the original docstring was empty.
+            or `None` if the original docstring was empty or only contained whitespace.
     """
     if not doc:
-        return doc
+        return None
 
     txt = inspect.cleandoc(doc)
     lines = txt.splitlines()
@@ -197,18 +248,12 @@ def _normalize_document(doc: Optional[str]) -> Optional[str]:
     out: List[str] = []
     num_lines = len(lines)
 
-    headers_map = {
-        **{item: '*Args:*'    for item in SECTIONS},
-        **{item: '*Returns:*' for item in RETURNS},
-        **{item: '*Raises:*'  for item in RAISES},
-    }
-
     while idx < num_lines:
         line = lines[idx]
         stripped = line.strip()
 
-        if stripped in headers_map:
-            out.append(headers_map[stripped])
+        if stripped in HEADERS:
+            out.append(HEADERS[stripped])
             idx += 1
 
             idx, items = _format_block_text(idx, num_lines, lines)
@@ -224,7 +269,9 @@ def _normalize_document(doc: Optional[str]) -> Optional[str]:
 
         idx += 1
 
-    return '\n'.join(out)
+    txt = '\n'.join(out)
+
+    return txt if txt.strip() else None # Blank docstrings are treated as missing
 
 def _format_block_text(idx: int, num_lines: int, lines: List[str]) -> Tuple[int, List[str]]:
     """
@@ -257,8 +304,7 @@ def _format_block_text(idx: int, num_lines: int, lines: List[str]) -> Tuple[int,
     idx_local = idx
 
     while idx_local < num_lines and (
-        lines[idx_local].startswith('    ')
-        or lines[idx_local].startswith('\t')
+        lines[idx_local].startswith(('    ', '\t'))
         or not lines[idx_local].strip()
     ):
         cursor = lines[idx_local]
@@ -272,7 +318,7 @@ def _format_block_text(idx: int, num_lines: int, lines: List[str]) -> Tuple[int,
         indent = len(cursor) - len(cursor.lstrip())
 
         # It attempts to detect the pattern → name: description
-        match_cursor = re.match(r'\s*([^:]+):\s*(.*)', cursor)
+        match_cursor = ITEM_PATTERN.match(cursor)
 
         if match_cursor:
             name = match_cursor.group(1).strip()
@@ -2,21 +2,26 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
-import sys
+import os
 import logging
+import importlib
 import traceback
-from typing import List, TYPE_CHECKING
+from functools import partial
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Tuple, Optional, Callable, TYPE_CHECKING
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
-from src.analyzers import *
-from src.renderers import *
 from src.tools.scanner import scanner
+from helpers.cache import AnalysisCache
 from helpers.traces import error_trace
+from handlers.logger import HandlerLogger
 from common.constants import ALGORITHM
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from src.models import ModuleInfo
     from common.settings import Settings
 # ---------------------------------------------------------------------------------------------------------------------
@@ -29,45 +34,137 @@ logger = logging.getLogger(ALGORITHM)
 Instance of the logger used by the analysis module.
 """
 
+# Number of files to analyze below which they are analyzed in the current process, since starting 
+# the worker processes of the pool takes longer than the analysis itself
+SERIAL_FILES = 16
+
 def execute(settings: Settings) -> None:
     """
     Executes the main flow of automatic documentation generation for the project.
 
     **This function coordinates all stages of the Codemnesis process:**
         1. Scans the specified repository for files in the supported language.
-        2. Analyzes each file found to extract its structure (classes, functions, and docstrings).
+        2. Analyzes each file found, in parallel (or serially when only a few files are pending), to extract 
+        its structure (classes, functions, and docstrings), reusing the analysis stored in the cache for 
+        files that have not changed.
         3. Generates a README file with the consolidated documentation.
-        4. Generates a visual dependency graph between modules.
+        4. Generates a visual dependency graph between modules, while the PDF report is built.
 
     Args:
         settings (Settings):
             Object that contains the general settings for the execution of the algorithm.
     """
-    logger.info(f"Scanning repository: {settings.repository}")
+    logger.info("Scanning repository: %s", settings.repository)
     files = list(scanner(settings.repository, settings.included, settings.excluded))
-    logger.info(f"Number of {settings.framework} files found: {len(files)}")
+    logger.info("Number of %s files found: %d", settings.framework, len(files))
     
-    analyze_method = globals().get(f'analyze_{settings.framework}')
+    # The analyzer is imported on demand, only the one for the requested framework is needed
+    analyzer = importlib.import_module(f'src.analyzers.{settings.framework}')
+    analyze_method = getattr(analyzer, f'analyze_{settings.framework}')
+
+    with AnalysisCache(settings.output) as cache:
+        removed = cache.prune(files) # Deleted or renamed files
+        if removed:
+            logger.info("Number of cache entries removed for files that no longer exist: %d", removed)
+
+        cached = {file: cache.get(file) for file in files}
+        pending = [file for file, module in cached.items() if module is None]
+        logger.info("Number of %s files reused from cache: %d", settings.framework, len(files) - len(pending))
+
+        if pending:
+            # Taken before the analysis, a file edited meanwhile must not be stored with its new signature
+            signatures = {file: cache.stamp(file) for file in pending}
+
+            workers = os.cpu_count() or 1
+            analyze = partial(_analyze, analyze_method, framework=settings.framework)
+
+            if workers == 1 or len(pending) < SERIAL_FILES:
+                # Starting the pool costs more than analyzing a few files, so they are analyzed here
+                results = list(map(analyze, pending))
+            else:
+                chunksize = max(1, len(pending) // (workers * 4))
+
+                # Each file is parsed independently, so the analysis is distributed among processes 
+                # (parsing is CPU-bound and threads would be serialized by the GIL)
+                with ProcessPoolExecutor(
+                    max_workers=workers, 
+                    initializer=HandlerLogger.worker, 
+                    initargs=(HandlerLogger.queue(),)
+                ) as executor:
+                    results = list(executor.map(analyze, pending, chunksize=chunksize))
+
+            for file, result in zip(pending, results):
+                if result is not None:
+                    module, digest = result
+                    if signatures[file] is not None:
+                        cache.set(file, module, signatures[file], digest)
+
+                    cached[file] = module
+
+    modules: List[ModuleInfo] = [module for module in cached.values() if module is not None]
 
-    modules: List[ModuleInfo] = []
-    for file in files:
-        try:
-            modules.append(analyze_method(file, settings.framework))
-        except Exception as error:
-            traces = traceback.extract_tb(error.__traceback__)
-            error_trace(traces, logger, error)
+    # The modules are sorted by path once here, so the renderers that need them in that order 
+    # sort an already ordered list (a single linear pass of Timsort)
+    modules.sort(key=attrgetter('path'))
 
-    logger.info(f"Generating README ...")
+    # Renderers (and their heavy dependencies, such as Graphviz or ReportLab) are imported only when 
+    # they are going to be used, so the worker processes of the pool never pay for them
+    from src.renderers import render_readme, render_graphic, render_report
+
+    logger.info("Generating README ...")
     readme_path = render_readme(modules, settings.repository, settings.output)
-    logger.info(f"README generated: {readme_path}")
+    logger.info("README generated: %s", readme_path)
+
+    # Most of the time of the graph is spent waiting for the Graphviz process (without holding the GIL), 
+    # so it is rendered in a thread while the report is built in the main one
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        logger.info("Generating dependency graph ...")
+        graphic = executor.submit(
+            render_graphic, modules, settings.output, settings.repository, settings.framework
+        )
+
+        logger.info("Generating report ...")
+        report_path = render_report(modules, settings.output, settings.repository, settings.framework)
+        logger.info("Report generated: %s", report_path)
+
+        graphic_path = graphic.result()
+        logger.info("Dependency graph generated: %s", graphic_path)
+
+def _analyze(
+    analyze_method: Callable[[Path, str, bytes], ModuleInfo], 
+    file: Path, 
+    *, 
+    framework: str
+) -> Optional[Tuple[ModuleInfo, str]]:
+    """
+    Analyzes a single file inside a worker process of the pool.
+
+    The file is read once here, and the same content is analyzed and hashed for the cache.
 
-    logger.info("Generating dependency graph ...")
-    graphic_path = render_graphic(modules, settings.output, settings.repository, settings.framework)
-    logger.info(f"Dependency graph generated: {graphic_path}")
+    Exceptions are captured and recorded here, in the process where they occurred, so that the 
+    traceback still points to the internal code that failed and a single faulty file does not 
+    interrupt the analysis of the rest of the repository.
 
-    logger.info("Generating report ...")
-    report_path = render_report(modules, settings.output, settings.repository, settings.framework)
-    logger.info(f"Report generated: {report_path}")
+    Args:
+        analyze_method (Callable[[Path, str, bytes], ModuleInfo]):
+            Analysis function associated with the framework.
+        file (Path):
+            Path of the file to be analyzed.
+        framework (str):
+            Name of the framework used, which must have a compatible mapping method.
+
+    Returns:
+        (Tuple[ModuleInfo, str] | None):
+            Object describing the structural content of the module and hash of the analyzed content, 
+            or `None` if the analysis failed.
+    """
+    try:
+        data = file.read_bytes()
+        return analyze_method(file, framework, data), AnalysisCache.digest(data)
+    except Exception as error:
+        traces = traceback.extract_tb(error.__traceback__)
+        error_trace(traces, logger, error)
+        return None
 
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
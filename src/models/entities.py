@@ -14,7 +14,7 @@ from src.models.metrics import ModuleMetrics
 
 __all__ = ['AttributeInfo', 'FunctionInfo', 'ClassInfo', 'ModuleInfo']
 
-@dataclass
+@dataclass(slots=True)
 class AttributeInfo:
     """
     Represents the basic information of an attribute found within a class.
@@ -31,7 +31,7 @@ class AttributeInfo:
     lineno: int
     doc: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     """
     Represents the basic information of a function found within a module or class.
@@ -51,7 +51,7 @@ class FunctionInfo:
     doc: Optional[str] = None
     decorators: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """
     Contains the structural information of a class detected during module analysis.
@@ -77,7 +77,7 @@ class ClassInfo:
     attributes: List[AttributeInfo] = field(default_factory=list)
     decorators: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class ModuleInfo:
     """
     Represents the analyzed structure of a source code file or module.
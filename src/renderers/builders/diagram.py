@@ -2,13 +2,14 @@
 # ---------------------------------------------------------------------------------------------------------------------
 import re
 from pathlib import Path
+from collections import defaultdict
 from graphviz import Digraph
 from typing import List, Dict, Set
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
-from src.utils.maps import identifiers_map
+from src.utils.maps import identifiers_map, repository_root
 from common.constants import ALGORITHM_VERSION
 # ---------------------------------------------------------------------------------------------------------------------
 
@@ -51,7 +52,8 @@ def dependency_diagram(repository: str, dep_map: Dict[str, Set[str]], file_forma
             Graphviz object ready to be rendered in the specified format.
     """
     title = f'Dependency diagram generated by Codemnesis - v.{ALGORITHM_VERSION}'
-    subtitle = f'Repository analyzed: {Path(repository).resolve().name}'
+    root = Path(repository_root(repository))
+    subtitle = f'Repository analyzed: {root.name}'
     
     dot = Digraph(
         format=file_format,
@@ -80,13 +82,14 @@ def dependency_diagram(repository: str, dep_map: Dict[str, Set[str]], file_forma
     # This avoids problems with long paths and ensures valid IDs for Graphviz
     id_map = identifiers_map(all_path)
 
-    root = Path(repository).resolve()
-    groups: Dict[str, List[str]] = {}
+    groups: Dict[str, List[str]] = defaultdict(list)
+    group_of: Dict[str, str] = {} # Group of each path, so that the edges do not have to resolve it again
     for path in all_path:
         parent = Path(path).resolve().parent
         relative = parent.relative_to(root)
         group_key = relative.as_posix() if str(relative) != '.' else 'root'
-        groups.setdefault(group_key, []).append(path)
+        groups[group_key].append(path)
+        group_of[path] = group_key
 
     # For each folder (group), two subgraphs are created:
     #   outer: invisible wrapper that helps space clusters
@@ -119,20 +122,14 @@ def dependency_diagram(repository: str, dep_map: Dict[str, Set[str]], file_forma
         dot.subgraph(outer)
 
     # Creation of dependency edges between modules
+    edge = dot.edge
     for src, targets in dep_map.items():
-        src_parent = Path(src).resolve().parent
-        src_relative = src_parent.relative_to(root)
-        src_group = src_relative.as_posix() if str(src_relative) != '.' else 'root'
+        src_group = group_of[src]
         src_id = id_map[src]
 
         for dest in targets:
-            dest_parent = Path(dest).resolve().parent
-            dest_relative = dest_parent.relative_to(root)
-            dest_group = dest_relative.as_posix() if str(dest_relative) != '.' else 'root'
-            dest_id = id_map[dest]
-
-            same_group = (src_group == dest_group)
-            dot.edge(src_id, dest_id, color=EDGE_INTRA if same_group else EDGE_INTER)
+            same_group = (src_group == group_of[dest])
+            edge(src_id, id_map[dest], color=EDGE_INTRA if same_group else EDGE_INTER)
 
     return dot
 
@@ -2,8 +2,12 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
-from pathlib import Path
-from typing import List, Dict, Union, Set, TYPE_CHECKING
+import os
+import heapq
+from itertools import chain
+from collections import Counter
+from operator import itemgetter
+from typing import List, Dict, Union, Set, Tuple, TYPE_CHECKING
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -17,13 +21,39 @@ if TYPE_CHECKING:
 # OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
 # ---------------------------------------------------------------------------------------------------------------------
 
+# Sort keys shared by the helpers, `itemgetter` extracts the value in C instead of calling a lambda per module
+SLOC_KEY = itemgetter('sloc')
+
+# Reasons why a module is considered a hotspot, the size reasons are indexed by level (none, >= 10%, >= 20%)
+SIZE_REASONS = (
+    '',
+    "Relevant module by size (\u2265 10\u0025 of total SLOC).",
+    "Very large module (\u2265 20\u0025 of total SLOC)."
+)
+METHODS_REASON = "Many methods (potentially high complexity)."
+DOCUMENTATION_REASON = "Low documentation coverage (\u2264 50\u0025)."
+
+# Comment of every possible combination of reasons (size level, many methods, low documentation), joined 
+# only once instead of once per module
+HOTSPOT_COMMENTS = {
+    (size, methods, documentation): '\n'.join(
+        reason for reason in (
+            SIZE_REASONS[size], 
+            METHODS_REASON if methods else '', 
+            DOCUMENTATION_REASON if documentation else ''
+        ) 
+        if reason
+    )
+    for size in range(len(SIZE_REASONS)) 
+    for methods in (False, True) 
+    for documentation in (False, True)
+}
+
 def general_summary(
     sloc: int, 
     framework: str,
     repository_name: str,
-    class_percent: Union[float, int], 
-    method_percent: Union[float, int], 
-    attribute_percent: Union[float, int],
+    doc_average: Union[float, int],
     module_stats: List[Dict[str, Union[str, int]]],
     hotspots: List[Dict[str, Union[str, int]]]
 ) -> Dict[str, Union[str, List[str]]]:
@@ -44,12 +74,8 @@ def general_summary(
             Name of the framework used, which must have a compatible mapping method.
         repository_name (str):
             Name of the repository/project.
-        class_percent (Union[float, int]):
-            Percentage of documented classes out of the total.
-        method_percent (Union[float, int]):
-            Percentage of documented methods out of the total.
-        attribute_percent (Union[float, int]):
-            Percentage of documented attributes out of the total.
+        doc_average (Union[float, int]):
+            Average documentation coverage of classes, methods and attributes.
         module_stats (List[Dict[str, Union[str, int]]]):
             List with detailed statistics by module.
         hotspots (List[Dict[str, Union[str, int]]]):
@@ -64,7 +90,6 @@ def general_summary(
         f'The repository contains {len(module_stats)} modules with a total of {sloc} source lines of code.'
     )
 
-    doc_average = average([class_percent, method_percent, attribute_percent])
     if doc_average >= 75:
         key_points.append('The overall documentation coverage is high across the codebase.')
     elif doc_average >= 50:
@@ -151,23 +176,14 @@ def hotspots_modules(sloc: int, module_stats: List[Dict[str, Union[str, int]]])
         if not stats['sloc']:
             continue
         
-        comment = []
-
         sloc_percentage = percentage(stats['sloc'], sloc)
-        if sloc_percentage >= 20:
-            comment.append("Very large module (\u2265 20\u0025 of total SLOC).")
-        elif sloc_percentage >= 10:
-            comment.append("Relevant module by size (\u2265 10\u0025 of total SLOC).")
-        else:
-            pass # Size is only considered relevant above 10% of the total SLOC
+        size = 2 if sloc_percentage >= 20 else 1 if sloc_percentage >= 10 else 0 # Only relevant above 10%
 
-        if stats['n_methods'] >= 15:
-            comment.append("Many methods (potentially high complexity).")
+        many_methods = stats['n_methods'] >= 15
 
-        doc_percentage = percentage(stats['documented_items'], stats['total_items']) if stats['total_items'] else 0
-        if stats['total_items'] and doc_percentage <= 50:
-            comment.append("Low documentation coverage (\u2264 50\u0025).")
+        low_documentation = bool(stats['total_items']) and stats['doc_percent'] <= 50
 
+        comment = HOTSPOT_COMMENTS[size, many_methods, low_documentation]
         if not comment:
             continue
 
@@ -176,14 +192,11 @@ def hotspots_modules(sloc: int, module_stats: List[Dict[str, Union[str, int]]])
             'sloc': stats['sloc'],
             'percent': f'{sloc_percentage}\u0025',
             'num_percent': sloc_percentage,
-            'comment': '\n'.join(comment)
+            'comment': comment
         })
 
-    return sorted(
-        candidates, 
-        key=lambda candidate: (candidate['num_percent'], candidate['sloc']),
-        reverse=True
-    )
+    # Every candidate is returned, so a full sort on the numeric percentage is required here
+    return sorted(candidates, key=itemgetter('num_percent', 'sloc'), reverse=True)
 
 def complexity_notes(sloc: int, module_stats: List[Dict[str, Union[str, int]]], *, limit: int = 10) -> List[str]:
     """
@@ -219,8 +232,23 @@ def complexity_notes(sloc: int, module_stats: List[Dict[str, Union[str, int]]],
     
     notes = []
 
+    LARGE_SLOC = 1000  # heuristic threshold
+    MANY_METHODS = 30  # heuristic threshold
+
+    # Total of methods, very large modules by absolute size and modules with many methods 
+    # are collected in a single pass
+    total_methods = 0
+    large_modules = []
+    heavy_method_modules = []
+    for module in module_stats:
+        n_methods = module['n_methods']
+        total_methods += n_methods
+        if module['sloc'] >= LARGE_SLOC:
+            large_modules.append(module)
+        if n_methods >= MANY_METHODS:
+            heavy_method_modules.append(module)
+
     num_modules = len(module_stats)
-    total_methods = sum(int(module['n_methods']) for module in module_stats)
 
     sloc_average = average(sloc, divider=num_modules, round_off=True) if num_modules else 0
     methods_average = average(total_methods, divider=num_modules, round_off=True, decimals=1) if num_modules else 0
@@ -230,11 +258,8 @@ def complexity_notes(sloc: int, module_stats: List[Dict[str, Union[str, int]]],
     )
 
     # Identify very large modules by absolute size
-    LARGE_SLOC = 1000  # heuristic threshold
-    large_modules = [module for module in module_stats if int(module['sloc']) >= LARGE_SLOC]
-
     if large_modules:
-        names = ', '.join(module['name'] for module in large_modules[:limit])
+        names = ', '.join([module['name'] for module in large_modules[:limit]])
 
         if len(large_modules) == 1:
             notes.append(
@@ -247,29 +272,22 @@ def complexity_notes(sloc: int, module_stats: List[Dict[str, Union[str, int]]],
                 f'({names}), concentrating a significant amount of logic.'
             )
 
-    # Concentration in the code base: the top 20% of modules by SLOC
-    sorted_by_sloc = sorted(
-        module_stats,
-        key=lambda module: int(module['sloc']),
-        reverse=True
-    )
-
+    # Concentration in the code base: the top 20% of modules by SLOC, which are selected 
+    # without sorting the rest of the modules
     top_count = max(1, int(num_modules * 0.2))
-    top_modules = sorted_by_sloc[:top_count]
-    sloc_top = sum(int(module['sloc']) for module in top_modules)
+    top_modules = heapq.nlargest(top_count, module_stats, key=SLOC_KEY)
+    sloc_top = sum(module['sloc'] for module in top_modules)
     sloc_top_percent = percentage(sloc_top, sloc)
     if sloc_top_percent >= 50:
-        names = ', '.join(module['name'] for module in top_modules[:limit])
+        names = ', '.join([module['name'] for module in top_modules[:limit]])
         notes.append(
             f'A small group of modules ({top_count} modules: {names}) '
             f'contains about {sloc_top_percent}\u0025 of the total SLOC.'
         )
 
     # Modules with many methods (possible God objects)
-    MANY_METHODS = 30  # heuristic threshold
-    heavy_method_modules = [module for module in module_stats if int(module['n_methods']) >= MANY_METHODS]
     if heavy_method_modules:
-        names = ', '.join(m['name'] for m in heavy_method_modules[:limit])
+        names = ', '.join([m['name'] for m in heavy_method_modules[:limit]])
         notes.append(
             f'Some modules declare a large number of methods ({MANY_METHODS} or more), '
             f'which may complicate maintenance ({names}).'
@@ -306,90 +324,43 @@ def documentation_coverage(
         'attribute_percent': f'{attribute_percent}\u0025.'
     }
 
-def best_documented_modules(module_stats: List[Dict[str, Union[str, int]]], *, limit: int = 5) -> List[Dict]:
+def documented_modules(
+    module_stats: List[Dict[str, Union[str, int]]], 
+    *, 
+    limit: int = 5
+) -> Tuple[List[Dict], List[Dict]]:
     """
-    Select the modules with the best documentation coverage.
+    Select the modules with the best and the worst documentation coverage.
 
-    Calculate, for each module, the percentage of documented items: `documented_items / total_items * 100`, 
-    and return the best ones sorted from highest to lowest.
+    Use, for each module, the percentage of documented items (`doc_percent`): `documented_items / total_items * 100`, 
+    and return the best ones sorted from highest to lowest, and the worst ones sorted from lowest to highest 
+    to identify modules that require priority attention in terms of documentation.
 
     **Notes:**
         - Modules with `total_items == 0` are omitted to avoid invalid divisions.
+        - The percentages are calculated once and shared by both selections.
 
     Args:
         module_stats (List[Dict[str, Union[str, int]]]):
             List with detailed statistics by module.
         limit (int, optional):
-            Maximum number of modules to be returned.
+            Maximum number of modules to be returned in each list.
 
     Returns:
-        List:
-            List of items (dictionaries) sorted by descending percentage, truncated to `limit`.
+        Tuple[List[Dict], List[Dict]]:
+            Items (dictionaries) of the best documented modules sorted by descending percentage, and of the 
+            worst documented modules sorted by ascending percentage, both truncated to `limit`.
     """
-    candidates = []
+    percentages = _documentation_percentages(module_stats)
 
-    for stats in module_stats:
-        total_items = stats['total_items']
-        if not total_items:
-            continue
-        
-        doc_percentage = percentage(stats['documented_items'], total_items)
-
-        candidates.append({
-            'name': f'{stats["name"]}:',
-            'text':f'{doc_percentage}\u0025 of this module is documented.',
-            'percent': doc_percentage
-        })
-
-    return sorted(
-        candidates,
-        key=lambda candidate: candidate['percent'],
-        reverse=True
-    )[:limit]
-
-def worst_documented_modules(module_stats: List[Dict[str, Union[str, int]]], *, limit: int = 5) -> List[Dict]:
-    """
-    Select the modules with the worst documentation coverage.
-
-    Same as `_best_documented_modules`, but sorted from lowest to highest percentage to identify modules that 
-    require priority attention in terms of documentation.
-
-    **Notes:**
-        - Modules with `total_items == 0` are omitted.
-
-    Args:
-        module_stats (List[Dict[str, Union[str, int]]]):
-            List with detailed statistics by module.
-        limit (int, optional):
-            Maximum number of modules to be returned.
-
-    Returns:
-        List:
-            List of items (dictionaries) sorted by ascending percentage, truncated to `limit`.
-    """
-    candidates = []
-
-    for stats in module_stats:
-        total_items = stats['total_items']
-        if not total_items:
-            continue
-
-        doc_percentage = percentage(stats['documented_items'], total_items)
-
-        candidates.append({
-            'name': f'{stats["name"]}:',
-            'text':f'{doc_percentage}\u0025 of this module is documented.',
-            'percent': doc_percentage
-        })
+    # Only the first `limit` modules are needed, so they are selected without sorting the whole list
+    best = heapq.nlargest(limit, percentages, key=itemgetter(1))
+    worst = heapq.nsmallest(limit, percentages, key=itemgetter(1))
 
-    return sorted(
-        candidates,
-        key=lambda candidate: candidate['percent']
-    )[:limit]
+    return _documentation_items(best), _documentation_items(worst)
 
 def internal_dependencies(
     dep_map: Dict[str, Set[str]], 
-    repository: str, 
     *, 
     limit: int = 5, 
     factor: int = 2
@@ -413,8 +384,6 @@ def internal_dependencies(
         dep_map(Dict[str, Set[str]]): 
             Dictionary where each key is a module and its value is a set of modules on which 
             it depends.
-        repository (str):
-            Base path of the repository or project to be analyzed.
         limit (int, optional):
             Maximum number of modules to be returned.
         factor (int, optional):
@@ -438,18 +407,15 @@ def internal_dependencies(
     # out-degree: how many modules each module imports
     out_degree = {module: len(dep_map.get(module, set())) for module in modules}
 
-    # in-degree: how many modules matter to each module
-    in_degree = {module: 0 for module in modules}
-    for targets in dep_map.values():
-        for dest in targets:
-            if dest in in_degree:
-                in_degree[dest] += 1
-            else: # If a destination appears that is not listed as a key (a rare case), it will be added
-                in_degree[dest] = 1
-                out_degree.setdefault(dest, 0)
-                dep_map.setdefault(dest, set())
+    # in-degree: how many modules matter to each module, the edges are counted by `Counter` in a single 
+    # C-level pass. If a destination appears that is not listed as a key (a rare case), it will be added
+    in_degree = dict.fromkeys(modules, 0)
+    in_degree.update(Counter(chain.from_iterable(dep_map.values())))
 
-    all_modules = sorted(set(list(out_degree.keys()) + list(in_degree.keys())))
+    # The in-degree table already holds every module (keys of the map and stray destinations), so it is 
+    # sorted directly, without merging the keys of both tables. The map follows the order of the modules, 
+    # which are already sorted by path, so Timsort only needs a linear pass
+    all_modules = sorted(in_degree)
 
     num_modules = len(all_modules)
     total_edges = sum(out_degree.get(module, 0) for module in all_modules)
@@ -476,12 +442,8 @@ def internal_dependencies(
     else:
         summary_parts.append('No completely independent modules were found.')
 
-    # Core modules (most referenced): highest in-degree (NOT in+out)
-    most_referenced = sorted(
-        all_modules,
-        key=lambda module: in_degree.get(module, 0),
-        reverse=True
-    )[:limit]
+    # Core modules (most referenced): highest in-degree (NOT in+out), only the first `limit` are selected
+    most_referenced = heapq.nlargest(limit, all_modules, key=in_degree.get)
 
     core_modules = []
     for module in most_referenced:
@@ -493,7 +455,7 @@ def internal_dependencies(
         # Excluding self-reference potential
         reference_percetage = percentage(indeg, max(1, num_modules - 1))
 
-        name = Path(module).resolve().relative_to(Path(repository).resolve()).name
+        name = os.path.basename(module)
         core_modules.append(f'{name}: referenced by \u007e{reference_percetage}\u0025 of the files in the repository.')
 
     if core_modules:
@@ -523,9 +485,7 @@ def internal_dependencies(
 
 def technical_risks(
     sloc: int,
-    class_percent: Union[float, int], 
-    method_percent: Union[float, int], 
-    attribute_percent: Union[float, int],
+    doc_average: Union[float, int],
     module_stats: List[Dict[str, Union[str, int]]],
     hotspots: List[Dict[str, Union[str, int]]],
     dependencies: Dict[str, Union[int, float, List[str], str]],
@@ -550,12 +510,8 @@ def technical_risks(
     Args:
         sloc (int):
             Number of meaningful lines in the file, excluding comments and blank lines.
-        class_percent (Union[float, int]):
-            Percentage of documented classes out of the total.
-        method_percent (Union[float, int]):
-            Percentage of documented methods out of the total.
-        attribute_percent (Union[float, int]):
-            Percentage of documented attributes out of the total.
+        doc_average (Union[float, int]):
+            Average documentation coverage of classes, methods and attributes.
         module_stats (List[Dict[str, Union[str, int]]]):
             List with detailed statistics by module.
         hotspots (List[Dict[str, Union[str, int]]]):
@@ -575,7 +531,6 @@ def technical_risks(
     risks: List[str] = []
 
     # Risk 1: Insufficient documentation
-    doc_average = average([class_percent, method_percent, attribute_percent])
     if doc_average < 35:
         risks.append(
             'Low documentation coverage: increases the risk of difficult maintenance and errors when modifying the code.'
@@ -589,23 +544,20 @@ def technical_risks(
     if sloc:
         top_count = max(1, int(len(module_stats) * 0.2))
 
-        sorted_by_sloc = sorted(module_stats, key=lambda module: int(module.get('sloc', 0)), reverse=True)
-
-        top_modules = sorted_by_sloc[:top_count]
-        top_sloc = sum(int(module.get('sloc', 0)) for module in top_modules)
+        # Only the top modules are selected, without sorting the rest of the modules
+        top_modules = heapq.nlargest(top_count, module_stats, key=SLOC_KEY)
+        top_sloc = sum(module['sloc'] for module in top_modules)
 
         top_percentage = percentage(top_sloc, sloc)
         if top_percentage >= 60:
             risks.append(f'High concentration of logic: {top_percentage}\u0025 of SLOC is in {top_count} modules.')
 
     # Risk 3: very large modules
-    large = [module for module in module_stats if int(module.get('sloc', 0)) >= 1500]
-    if large:
+    if any(module['sloc'] >= 1500 for module in module_stats):
         risks.append(f'There are very large modules (\u2265 1500 SLOC) that may require refactoring.')
 
     # Risk 4: Too many methods in one module
-    heavy_methods = [module for module in module_stats if int(module.get('n_methods', 0)) >= 40]
-    if heavy_methods:
+    if any(module['n_methods'] >= 40 for module in module_stats):
         risks.append(
             'Potentially high complexity: some modules have many methods (\u2265 40), '
             'which makes testing and changes difficult.'
@@ -627,9 +579,7 @@ def technical_risks(
 
 def risk_impact(
     sloc: int,
-    class_percent: Union[float, int], 
-    method_percent: Union[float, int], 
-    attribute_percent: Union[float, int],
+    doc_average: Union[float, int],
     hotspots: List[Dict[str, Union[str, int]]],
     dependencies: Dict[str, Union[int, float, List[str], str]]
 ) -> Dict[str, List[str]]:
@@ -648,12 +598,8 @@ def risk_impact(
     Args:
         sloc (int):
             Number of meaningful lines in the file, excluding comments and blank lines.
-        class_percent (Union[float, int]):
-            Percentage of documented classes out of the total.
-        method_percent (Union[float, int]):
-            Percentage of documented methods out of the total.
-        attribute_percent (Union[float, int]):
-            Percentage of documented attributes out of the total.
+        doc_average (Union[float, int]):
+            Average documentation coverage of classes, methods and attributes.
         hotspots (List[Dict[str, Union[str, int]]]):
             List of detected hotspots.
         dependencies (Dict[str, Union[int, float, List[str], str]]):
@@ -669,7 +615,6 @@ def risk_impact(
     # Maintainability
     maintainability = []
 
-    doc_average = average([class_percent, method_percent, attribute_percent])
     if doc_average < 40:
         maintainability.append(
             'The lack of documentation increases maintenance costs '
@@ -810,9 +755,7 @@ def risk_impact(
     }
     
 def recommendations(
-    class_percent: Union[float, int], 
-    method_percent: Union[float, int], 
-    attribute_percent: Union[float, int],
+    doc_average: Union[float, int],
     module_stats: List[Dict[str, Union[str, int]]],
     hotspots: List[Dict[str, Union[str, int]]],
     dependencies: Dict[str, Union[int, float, List[str], str]],
@@ -835,12 +778,8 @@ def recommendations(
             - High dependencies: `avg_dependencies` >= 5 (moderate from 2).
 
     Args:
-        class_percent (Union[float, int]):
-            Percentage of documented classes out of the total.
-        method_percent (Union[float, int]):
-            Percentage of documented methods out of the total.
-        attribute_percent (Union[float, int]):
-            Percentage of documented attributes out of the total.
+        doc_average (Union[float, int]):
+            Average documentation coverage of classes, methods and attributes.
         module_stats (List[Dict[str, Union[str, int]]]):
             List with detailed statistics by module.
         hotspots (List[Dict[str, Union[str, int]]]):
@@ -864,7 +803,7 @@ def recommendations(
     
     # Refactor
     if hotspots:
-        names = ', '.join(str(hot.get('name', '')) for hot in hotspots[:limit] if hot.get('name'))
+        names = ', '.join([str(hot.get('name', '')) for hot in hotspots[:limit] if hot.get('name')])
         if names:
             recommendations['refactor'].append(
                 f'Prioritize refactoring in hotspots to reduce complexity and isolate responsibilities ({names}).'
@@ -874,19 +813,27 @@ def recommendations(
                 'Prioritize refactoring in hotspots to reduce complexity and isolate responsibilities.'
             )
 
-    # Top modules by SLOC (for more specific suggestions)
-    sorted_by_sloc = sorted(module_stats, key=lambda module: int(module.get('sloc', 0)), reverse=True)
-    
-    big = [module for module in sorted_by_sloc if int(module.get('sloc', 0)) >= 1500]
+    # Top modules by SLOC (for more specific suggestions), both groups are collected in a single pass 
+    # and only the selected modules are sorted, instead of the whole list
+    big = []
+    heavy_methods = []
+    for module in module_stats:
+        if module['sloc'] >= 1500:
+            big.append(module)
+        if module['n_methods'] >= 40:
+            heavy_methods.append(module)
+
+    big.sort(key=SLOC_KEY, reverse=True)
+    heavy_methods.sort(key=SLOC_KEY, reverse=True)
+
     if big:
-        names = ', '.join(str(module.get('name', '')) for module in big[:limit] if module.get('name'))
+        names = ', '.join([str(module.get('name', '')) for module in big[:limit] if module.get('name')])
         recommendations['refactor'].append(
             f'Split very large modules (\u2265 1500 SLOC) into smaller, testable components. ({names}).'
         )
 
-    heavy_methods = [module for module in sorted_by_sloc if int(module.get('n_methods', 0)) >= 40]
     if heavy_methods:
-        names = ', '.join(str(module.get('name', '')) for module in heavy_methods[:limit] if module.get('name'))
+        names = ', '.join([str(module.get('name', '')) for module in heavy_methods[:limit] if module.get('name')])
         recommendations['refactor'].append(
             'Reduce modules with too many methods (\u2265 40): '
             f'extract services/helpers and simplify logic ({names}).'
@@ -898,7 +845,6 @@ def recommendations(
         )
 
     # Documentation
-    doc_average = average([class_percent, method_percent, attribute_percent])
     if doc_average < 35:
         recommendations['docs'].append(
             'Increase base documentation: add docstrings/summaries to main classes and methods.'
@@ -920,7 +866,7 @@ def recommendations(
 
     # If there are hotspots, specific documentation is suggested there
     if hotspots:
-        names = ', '.join(str(hot.get('name', '')) for hot in hotspots[:limit] if hot.get('name'))
+        names = ', '.join([str(hot.get('name', '')) for hot in hotspots[:limit] if hot.get('name')])
         if names:
             recommendations['docs'].append(
                 f'Add usage examples and design notes in hotspots to facilitate future modifications. ({names}).'
@@ -959,11 +905,53 @@ def recommendations(
             'Review independent modules: confirm whether they are intended as utilities, tests, or orphaned code.'
         )
 
-    recommendations['refactor'] = recommendations['refactor'][:limit]
-    recommendations['docs'] = recommendations['docs'][:limit]
-    recommendations['architecture'] = recommendations['architecture'][:limit]
+    # Each list is truncated in place, without allocating a copy
+    for recommendation in recommendations.values():
+        del recommendation[limit:]
     
     return recommendations
 
+def _documentation_percentages(module_stats: List[Dict[str, Union[str, int]]]) -> List[Tuple[str, float]]:
+    """
+    Collects the percentage of documented items of each module, already calculated in `module_stats`.
+
+    **Notes:**
+        - Modules with `total_items == 0` are omitted to avoid invalid divisions.
+
+    Args:
+        module_stats (List[Dict[str, Union[str, int]]]):
+            List with detailed statistics by module.
+
+    Returns:
+        List[Tuple[str, float]]:
+            Pairs with the name of the module and its percentage of documented items.
+    """
+    return [
+        (stats['name'], stats['doc_percent'])
+        for stats in module_stats
+        if stats['total_items']
+    ]
+
+def _documentation_items(selected: List[Tuple[str, float]]) -> List[Dict]:
+    """
+    Builds the items of the report for the modules selected by their documentation coverage.
+
+    Args:
+        selected (List[Tuple[str, float]]):
+            Pairs with the name of the module and its percentage of documented items.
+
+    Returns:
+        List:
+            List of items (dictionaries) in the same order as `selected`.
+    """
+    return [
+        {
+            'name': f'{name}:',
+            'text':f'{doc_percentage}\u0025 of this module is documented.',
+            'percent': doc_percentage
+        }
+        for name, doc_percentage in selected
+    ]
+
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
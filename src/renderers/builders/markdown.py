@@ -2,12 +2,15 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from operator import attrgetter
 from typing import List, Optional, TYPE_CHECKING
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
+from src.utils.maps import relative_paths, repository_root
 from src.tools.docstring import format_docstring
 from common.constants import ALGORITHM_VERSION, NO_METHOD, NO_FUNCTION, NO_CLASS, NO_MODULE, NO_ATTRIBUTE
 
@@ -38,16 +41,20 @@ def generate_content(modules: List[ModuleInfo], repository: str, *, cleaned: Opt
         str:
             Text string with the complete content of the README formatted in Markdown.
     """
-    if cleaned is None:
-        cleaned = ['`']
+    # The tokens are converted to a tuple once, so that they can be used directly as the key 
+    # of the memoized cleanup of each docstring
+    cleaned = ('`',) if cleaned is None else tuple(cleaned)
+
+    root = Path(repository_root(repository))
+    relatives = relative_paths(modules, repository) # Without resolving the path of each module
 
     lines: List[str] = []
     lines.append(f'# 📑 Documentation generated by Codemnesis - v.{ALGORITHM_VERSION}\n')
-    lines.append(f'## 🗃️ *Repository analyzed*: `{Path(repository).resolve().name}`\n')
+    lines.append(f'## 🗃️ *Repository analyzed*: `{root.name}`\n')
 
-    for module in sorted(modules, key=lambda module: module.path):
-        relative = Path(module.path).resolve().relative_to(Path(repository).resolve())
-        lines.append(f'## 🗂️ Module: `{relative.as_posix()}`\n')
+    for module in sorted(modules, key=attrgetter('path')):
+        relative = relatives[module.path].replace(os.sep, '/')
+        lines.append(f'## 🗂️ Module: `{relative}`\n')
 
         if not module.classes and not module.functions:
             lines.append(f'*{NO_MODULE}*\n')
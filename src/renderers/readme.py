@@ -40,7 +40,7 @@ def render_readme(modules: List[ModuleInfo], repository: str, output: str) -> Pa
     path = Path(output)
     out = path / FILE
     text = generate_content(modules, repository)
-    out.write_text(text, encoding='utf-8')
+    out.write_bytes(text.encode('utf-8')) # Encoded in a single call, without the text layer of `write_text`
     return out
     
 # ---------------------------------------------------------------------------------------------------------------------
@@ -2,6 +2,7 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import List, TYPE_CHECKING
@@ -9,12 +10,13 @@ from typing import List, TYPE_CHECKING
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
-from src.utils.maps import dependencies_map
+from src.utils.maps import dependencies_map, repository_root
+from src.tools.nums import average
 from src.utils.metrics import repository_metrics
 from src.renderers.builders.document import Document
 from src.renderers.builders.insights import (
     general_summary, global_stats, complexity_notes, documentation_coverage, 
-    hotspots_modules, best_documented_modules, worst_documented_modules, 
+    hotspots_modules, documented_modules, 
     internal_dependencies, technical_risks, risk_impact, recommendations
 )
 
@@ -38,6 +40,8 @@ def render_report(modules: List[ModuleInfo], output: str, repository: str, frame
     global statistics, documentation coverage, hotspots, and internal dependencies, and builds a report 
     with predefined sections.
 
+    If there are no modules, a minimal report is built that only states that there is no data.
+
     Args:
         modules (List[ModuleInfo]):
             List of `ModuleInfo` objects representing the analyzed modules in the repository.
@@ -53,19 +57,38 @@ def render_report(modules: List[ModuleInfo], output: str, repository: str, frame
             Absolute path to the generated PDF file.
     """
     out = Path(output) / PDF_FILE
-    repository_name = Path(repository).resolve().name
-
-    statistics = repository_metrics(modules, repository)
+    repository_name = os.path.basename(repository_root(repository))
+
+    if not modules:
+        # Without analyzed modules every section would be empty, so only the front page and a summary 
+        # stating it are built, without calculating any metric or dependency
+        doc = Document(str(out))
+        doc.front_page(
+            repository_name,
+            datetime.now().strftime('%A, %B %d, %Y')
+        )
+        doc.summary_page({
+            'repository_goal': f'No {framework} modules could be analyzed in the {repository_name} project.',
+            'scope': 'The analysis found no source files, or none of them could be analyzed.',
+            'key_points': ['There is no data to report.']
+        })
+        doc.build()
+        return out
+
+    statistics = repository_metrics(modules)
     doc_coverage = documentation_coverage(
         statistics.class_percent, 
         statistics.method_percent, 
         statistics.attribute_percent
     )
 
+    # Average coverage of classes, methods and attributes, shared by the summary, risks and recommendations
+    doc_average = average([statistics.class_percent, statistics.method_percent, statistics.attribute_percent])
+
     hotspots = hotspots_modules(statistics.sloc, statistics.module_stats)
 
     dep_map = dependencies_map(modules, repository, framework)
-    dependencies = internal_dependencies(dep_map, repository)
+    dependencies = internal_dependencies(dep_map)
 
     doc = Document(str(out))
     doc.front_page(
@@ -75,7 +98,7 @@ def render_report(modules: List[ModuleInfo], output: str, repository: str, frame
     doc.summary_page(
         general_summary(
             statistics.sloc, framework, repository_name,
-            statistics.class_percent, statistics.method_percent, statistics.attribute_percent,
+            doc_average,
             statistics.module_stats, hotspots
         )
     )
@@ -97,25 +120,24 @@ def render_report(modules: List[ModuleInfo], output: str, repository: str, frame
     )
     doc.documentation_coverage(
         doc_coverage,
-        best_documented_modules(statistics.module_stats),
-        worst_documented_modules(statistics.module_stats)
+        *documented_modules(statistics.module_stats)
     )
     doc.architecture_dependencies(dependencies)
     doc.risk_technical_debt(
         technical_risks(
             statistics.sloc,
-            statistics.class_percent, statistics.method_percent, statistics.attribute_percent,
+            doc_average,
             statistics.module_stats, hotspots, dependencies
         ),
         risk_impact(
             statistics.sloc,
-            statistics.class_percent, statistics.method_percent, statistics.attribute_percent,
+            doc_average,
             hotspots, dependencies
         )
     )
     doc.final_recommendations(
         recommendations(
-            statistics.class_percent, statistics.method_percent, statistics.attribute_percent,
+            doc_average,
             statistics.module_stats, hotspots, dependencies
         )
     )
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------------------------------------------------
 import re
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Dict, Tuple, Union, Optional
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -13,7 +13,7 @@ from typing import List, Optional
 # OPERATIONS / CLASS CREATION / GENERAL FUNCTIONS
 # ---------------------------------------------------------------------------------------------------------------------
 
-def format_docstring(doc: str, cleaned: List[str]) -> str:
+def format_docstring(doc: str, cleaned: Union[List[str], Tuple[str, ...]]) -> str:
     """
     Applies the full format to the received text (docstring) by cleanup steps.
 
@@ -23,8 +23,9 @@ def format_docstring(doc: str, cleaned: List[str]) -> str:
     Args:
         doc (str):
             Original text of the docstring to be formatted.
-        cleaned (List[str]): 
-            List of tokens to be removed using replace.
+        cleaned (List[str] | Tuple[str, ...]): 
+            List of tokens to be removed using replace. Passing a tuple avoids converting 
+            the list on every call.
 
     Returns:
         str:
@@ -32,33 +33,78 @@ def format_docstring(doc: str, cleaned: List[str]) -> str:
 
     Raises:
         TypeError:
-            If `cleaned` is provided but is not a list.
+            If `cleaned` is provided but is not a list or a tuple.
     """
     if cleaned:
-        if not isinstance(cleaned, list):
-            raise TypeError('The `cleaned` parameter must be a list of strings')
+        if not isinstance(cleaned, (list, tuple)):
+            raise TypeError('The `cleaned` parameter must be a list or a tuple of strings')
         
-        return _clean(doc, cleaned)
+        return _clean(doc, tuple(cleaned)) # A tuple is returned as is, without being copied
 
     return doc
 
-def _clean(doc: str, cleaned: List[str]) -> str:
+@lru_cache(maxsize=4096)
+def _clean(doc: str, cleaned: Tuple[str, ...]) -> str:
     """
     Removes unwanted formatting characters from docstring text.
 
+    The result is memoized, since identical docstrings are common across a repository 
+    (e.g. overridden methods or boilerplate descriptions).
+
     Args:
         doc (str):
             Text or docstring to be cleaned.
-        cleaned (List[str]): 
-            List of tokens to be removed using replace.
+        cleaned (Tuple[str, ...]): 
+            Tokens to be removed using replace.
 
     Returns:
         str:
             Text without special characters or formatting symbols.
     """
     text = doc.strip()
-    pattern = re.compile('|'.join(re.escape(token) for token in cleaned))
-    return pattern.sub('', text)
+
+    # Single characters (the usual case) are deleted with `translate`, which avoids the regex engine
+    table = _table(cleaned)
+    if table is not None:
+        return text.translate(table)
+
+    return _pattern(cleaned).sub('', text)
+
+@lru_cache(maxsize=None)
+def _table(tokens: Tuple[str, ...]) -> Optional[Dict[int, None]]:
+    """
+    Builds the translation table that deletes the tokens, when all of them are single characters.
+
+    Args:
+        tokens (Tuple[str, ...]):
+            Tokens to be removed.
+
+    Returns:
+        (Dict[int, None] | None):
+            Table for `str.translate`, or `None` if any token is not a single character.
+    """
+    if all(len(token) == 1 for token in tokens):
+        return str.maketrans('', '', ''.join(tokens))
+
+    return None
+
+@lru_cache(maxsize=None)
+def _pattern(tokens: Tuple[str, ...]) -> re.Pattern:
+    """
+    Builds the expression that removes all the tokens in a single pass over the text.
+
+    The expression is built only once for each set of tokens, since the same tokens are 
+    used for every docstring of the README.
+
+    Args:
+        tokens (Tuple[str, ...]):
+            Tokens to be removed.
+
+    Returns:
+        re.Pattern:
+            Compiled expression matching any of the tokens.
+    """
+    return re.compile('|'.join(re.escape(token) for token in tokens))
 
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
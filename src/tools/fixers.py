@@ -35,7 +35,7 @@ def fix_bullets(txt: Optional[str]) -> Optional[str]:
     for line in lines:
         stripped = line.lstrip()
 
-        if stripped.startswith('- ') or stripped.startswith('* '):
+        if stripped.startswith(('- ', '* ')):
             fixed.append(f'- {stripped[2:].strip()}')
         else:
             fixed.append(line)
@@ -15,6 +15,9 @@ def percentage(part: int, total: int, *, decimals: int = 2) -> Union[float, int]
     """
     Calculate the percentage that `part` represents of `total`.
 
+    The value is computed with integer arithmetic (scaled by the number of decimal places), so 
+    no floating point rounding is involved and exact halves are always rounded up.
+
     Args:
         part (int):
             The part value to compare against the total.
@@ -31,8 +34,11 @@ def percentage(part: int, total: int, *, decimals: int = 2) -> Union[float, int]
     if total == 0:
         return total
     
-    num = round((part / total) * 100, decimals)
-    return int(num) if num.is_integer() else num
+    scale = 10 ** decimals
+    scaled = (part * 100 * scale + total // 2) // total # Rounded to the nearest unit of the last decimal place
+    
+    whole, remainder = divmod(scaled, scale)
+    return whole if not remainder else scaled / scale
     
 def average(
     items: Union[List[Union[int, float]], float, int], 
@@ -89,7 +95,7 @@ def average(
         
         avg = round(avg, decimals)
 
-    return int(avg) if float(avg).is_integer() else avg
+    return int(avg) if avg.is_integer() else avg # True division (and `round`) always produce a float
 
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------------------------------------------------
 import os
 from pathlib import Path
-from typing import Set, Iterator
+from typing import Set, List, Iterator
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
@@ -31,15 +31,33 @@ def scanner(repository: str, included: Set[str], excluded: Set[str]) -> Iterator
             Absolute path of each file that meets the defined criteria.
     """
     root = Path(repository).resolve()
-
-    for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
-        dirnames[:] = [dirname for dirname in dirnames if dirname not in excluded]
-
-        for filename in filenames:
-            path = Path(dirpath) / filename
-            
-            if path.suffix in included:
-                yield path
+    pending = [str(root)]
+
+    # Iterative traversal with `os.scandir`: the type of each entry comes from the directory 
+    # listing itself, so no additional `stat` call is needed per file or directory
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as iterator:
+                entries = list(iterator)
+        except OSError:
+            continue # Unreadable directories are ignored, as `os.walk` does
+
+        dirnames: List[str] = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                # Symbolic links to directories are not followed
+                if entry.name not in excluded and not entry.is_symlink():
+                    dirnames.append(entry.path)
+            elif os.path.splitext(entry.name)[1] in included:
+                yield Path(entry.path)
+
+        # Reverse order so that subdirectories are visited in the same order in which they were listed
+        pending.extend(reversed(dirnames))
 
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
@@ -2,12 +2,16 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from functools import lru_cache
+from collections import defaultdict
 from typing import TYPE_CHECKING, List, Dict, Set
 # ---------------------------------------------------------------------------------------------------------------------
 
 # MODULES (INTERNAL)
 # ---------------------------------------------------------------------------------------------------------------------
+from common.constants import NAMESPACE_PREFIX
+
 if TYPE_CHECKING:
     from src.models import ModuleInfo
 # ---------------------------------------------------------------------------------------------------------------------
@@ -52,6 +56,62 @@ def identifiers_map(all_path: List[str]) -> Dict[str, str]:
     """
     return {path: f'm{idx}' for idx, path in enumerate(all_path)}
 
+@lru_cache(maxsize=None)
+def repository_root(repository: str) -> str:
+    """
+    Resolve the real path of the repository.
+
+    The same repository is resolved by several renderers during an execution, so the result 
+    is memoized and the filesystem is only queried the first time.
+
+    Args:
+        repository (str):
+            Base path of the repository or project to be analyzed.
+
+    Returns:
+        str:
+            Absolute path of the repository, with symbolic links resolved.
+    """
+    return os.path.realpath(repository)
+
+def relative_paths(modules: List[ModuleInfo], repository: str) -> Dict[str, str]:
+    """
+    Build a dictionary with the path of each module relative to the repository.
+
+    The repository is resolved only once. The paths of the modules found by the scanner already 
+    hang from it, so they are relativized by removing its prefix, and they are only resolved 
+    when they do not start with it.
+
+    Args:
+        modules (List[ModuleInfo]):
+            List of `ModuleInfo` objects representing the analyzed modules in the repository.
+        repository (str):
+            Base path of the repository or project to be analyzed.
+
+    Returns:
+        Dict:
+            Dictionary where the keys are the module paths and the values are the relative paths 
+            (with the separators of the operating system).
+
+    Raises:
+        ValueError:
+            When a module is not within the repository.
+    """
+    prefix = os.path.join(repository_root(repository), '')
+    relatives = {}
+
+    for module in modules:
+        path = module.path
+        if not path.startswith(prefix):
+            path = os.path.realpath(path)
+
+            if not path.startswith(prefix):
+                raise ValueError(f"The module {module.path} is not within the repository {repository}")
+
+        relatives[module.path] = path[len(prefix):]
+
+    return relatives
+
 def _resolve_imports(modules: List[ModuleInfo], paths: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
     """
     Builds the actual dependency map between repository modules.
@@ -132,28 +192,71 @@ def _physical_paths(modules: List[ModuleInfo], repository: str, framework: str)
         ValueError:
             When the framework does not have a registered compatible method.
     """
-    dct = {}
+    # The framework is constant during the whole call, so the mapping method is chosen only once
+    if framework == 'csharp':
+        return _csharp_paths(modules)
+    elif framework == 'python':
+        return _python_paths(modules, repository)
+    else:
+        raise ValueError(f"Check the execution parameters, the {framework} framework is not currently supported")
+
+def _csharp_paths(modules: List[ModuleInfo]) -> Dict[str, Set[str]]:
+    """
+    Retrieves the namespaces declared by C# modules along with their physical paths.
+
+    Args:
+        modules (List[ModuleInfo]):
+            List of `ModuleInfo` objects representing the analyzed modules in the repository.
+
+    Returns:
+        Dict:
+            Dictionary where each key is a namespace and each value is a set of file paths 
+            that declare it within the repository.
+    """
+    dct: Dict[str, Set[str]] = defaultdict(set) # Sets are only created for new keys
+
+    for module in modules:
+        # Namespaces are prefixed to distinguish them from regular imports, `removeprefix` checks 
+        # and removes the prefix in a single call, so the length only changes for namespaces
+        for imp in module.imports:
+            ns = imp.removeprefix(NAMESPACE_PREFIX)
+            if len(ns) != len(imp):
+                dct[ns].add(module.path)
+
+    return dict(dct) # Plain dictionary, so that lookups of unknown names do not create entries
+
+def _python_paths(modules: List[ModuleInfo], repository: str) -> Dict[str, Set[str]]:
+    """
+    Retrieves the importable names of Python modules along with their physical paths.
+
+    Each path is converted from absolute path → relative path → module name, and package 
+    initializers are also mapped with the name of the package.
+
+    Args:
+        modules (List[ModuleInfo]):
+            List of `ModuleInfo` objects representing the analyzed modules in the repository.
+        repository (str):
+            Base path of the repository or project to be analyzed.
+
+    Returns:
+        Dict:
+            Dictionary where each key is a module name and each value is a set of file paths 
+            that implement it within the repository.
+    """
+    dct: Dict[str, Set[str]] = defaultdict(set) # Sets are only created for new keys
+    relatives = relative_paths(modules, repository)
 
     for module in modules:
-        if framework == 'csharp': # Imports are prefixed with __ns__: to distinguish them from regular imports
-            for imp in getattr(module, 'imports', []):
-                if imp.startswith('__ns__:'):
-                    ns = imp[len('__ns__:'):]
-                    dct.setdefault(ns, set()).add(module.path)
-        elif framework == 'python': # Converts absolute path → relative path → module name
-            relative = Path(module.path).resolve().relative_to(Path(repository).resolve())
-            name = relative.with_suffix('').as_posix().replace('/', '.')
-            dct.setdefault(name, set()).add(module.path)
-
-            # If the file is a package initializer, also map the package name without .__init__
-            if name.endswith('.__init__'):
-                pkg = name[: -len('.__init__')]
-                if pkg:
-                    dct.setdefault(pkg, set()).add(module.path)
-        else:
-            raise ValueError(f"Check the execution parameters, the {framework} framework is not currently supported")
-        
-    return dct
+        name = os.path.splitext(relatives[module.path])[0].replace(os.sep, '.')
+        dct[name].add(module.path)
+
+        # If the file is a package initializer, also map the package name without .__init__
+        if name.endswith('.__init__'):
+            pkg = name[: -len('.__init__')]
+            if pkg:
+                dct[pkg].add(module.path)
+
+    return dict(dct) # Plain dictionary, so that lookups of unknown names do not create entries
 
 # ---------------------------------------------------------------------------------------------------------------------
 # END OF FILE
\ No newline at end of file
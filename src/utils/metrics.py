@@ -2,7 +2,8 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from operator import attrgetter
 from typing import List, TYPE_CHECKING
 # ---------------------------------------------------------------------------------------------------------------------
 
@@ -51,7 +52,7 @@ def module_metrics(src: str, classes: List[ClassInfo], funcs: List[FunctionInfo]
         n_methods=sum(len(cls.methods) for cls in classes)
     )
 
-def repository_metrics(modules: List[ModuleInfo], repository: str) -> RepositoryMetrics:
+def repository_metrics(modules: List[ModuleInfo]) -> RepositoryMetrics:
     """
     Calculates aggregate metrics for a repository from a list of modules that have already been analyzed.
 
@@ -60,7 +61,7 @@ def repository_metrics(modules: List[ModuleInfo], repository: str) -> Repository
 
     In addition, it builds two structures per module:
         - modules_overview: general summary per file (lines, number of classes/methods/functions, and attributes).
-        - module_stats: documentation-oriented summary per file (SLOC, counts, and % implied via totals).
+        - module_stats: documentation-oriented summary per file (SLOC, counts, and % of documented items).
 
     Args:
         modules (List[ModuleInfo]):
@@ -68,8 +69,6 @@ def repository_metrics(modules: List[ModuleInfo], repository: str) -> Repository
                 - path: module file path.
                 - metrics: object with metrics.
                 - classes: collection of module classes; each class with doc, methods, and attributes.
-        repository (str):
-            Root path of the repository. Used to calculate a relative file name, taking the name from the relative path.
 
     Returns:
         RepositoryMetrics:
@@ -90,18 +89,18 @@ def repository_metrics(modules: List[ModuleInfo], repository: str) -> Repository
     module_stats = []
     modules_overview = []
     
-    for module in sorted(modules, key=lambda module: module.path):
+    for module in sorted(modules, key=attrgetter('path')):
         metrics = module.metrics
 
         if not metrics:
             continue
 
-        module_name = Path(module.path).resolve().relative_to(Path(repository).resolve()).name
+        module_name = os.path.basename(module.path) # Only the file name is reported, no path resolution needed
 
         loc += metrics.loc or 0
         sloc += metrics.sloc or 0
 
-        module_classes = 0
+        module_classes = len(module.classes)
         module_documented_classes = 0
 
         module_methods = 0
@@ -110,30 +109,30 @@ def repository_metrics(modules: List[ModuleInfo], repository: str) -> Repository
         module_attributes = 0
         module_documented_attributes = 0
 
+        # A single pass over the classes, blank documentation is already stored as `None` by the analyzers
         for cls in module.classes:
-            classes += 1
-            module_classes += 1
-
-            if cls.doc and cls.doc.strip():
-                documented_classes += 1
+            if cls.doc is not None:
                 module_documented_classes += 1
 
+            module_methods += len(cls.methods)
             for meth in cls.methods:
-                methods += 1
-                module_methods += 1
-
-                if meth.doc and meth.doc.strip():
-                    documented_methods += 1
+                if meth.doc is not None:
                     module_documented_methods += 1
 
+            module_attributes += len(cls.attributes)
             for attr in cls.attributes:
-                attributes += 1
-                module_attributes += 1
-
-                if attr.doc and attr.doc.strip():
-                    documented_attributes += 1
+                if attr.doc is not None:
                     module_documented_attributes += 1
 
+        classes += module_classes
+        documented_classes += module_documented_classes
+
+        methods += module_methods
+        documented_methods += module_documented_methods
+
+        attributes += module_attributes
+        documented_attributes += module_documented_attributes
+
         modules_overview.append({
             'name': module_name,
             'loc': metrics.loc,
@@ -144,14 +143,18 @@ def repository_metrics(modules: List[ModuleInfo], repository: str) -> Repository
             'n_attributes': module_attributes
         })
 
+        total_items = module_classes + module_methods + module_attributes
+        documented_items = module_documented_classes + module_documented_methods + module_documented_attributes
+
         module_stats.append({
             'name': module_name,
             'sloc': metrics.sloc or 0,
             'n_classes': metrics.n_classes,
             'n_methods': metrics.n_methods,
             'n_functions': metrics.n_functions,
-            'total_items': module_classes + module_methods + module_attributes,
-            'documented_items': module_documented_classes + module_documented_methods + module_documented_attributes
+            'total_items': total_items,
+            'documented_items': documented_items,
+            'doc_percent': percentage(documented_items, total_items) # Shared by every insight on documentation
         })
 
     return RepositoryMetrics(